@@ -0,0 +1,10 @@
+"""In-process caches for Graph responses"""
+
+from cachetools import TTLCache
+import hashlib
+
+# Keyed by a hash so raw access tokens are never stored as keys
+pages_cache = TTLCache(maxsize=10_000, ttl=300)
+
+def cache_key(secret: str) -> str:
+    return hashlib.sha256(secret.encode()).hexdigest()
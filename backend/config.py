@@ -0,0 +1,67 @@
+"""Environment configuration shared by the app and its routers
+
+Read and validated once at import, so a missing required variable fails at startup
+instead of on the first request.
+"""
+
+import os
+from dotenv import load_dotenv
+from pydantic import AnyHttpUrl, Field, SecretStr, TypeAdapter, field_validator
+from pydantic_settings import BaseSettings
+
+# Load environment variables
+load_dotenv()
+
+FB_API_VERSION = "v21.0"
+
+_HTTP_URL = TypeAdapter(AnyHttpUrl)
+
+class Settings(BaseSettings):
+    # Meta Config
+    fb_app_id: str
+    fb_app_secret: SecretStr
+    fb_graph_url: str = f"https://graph.facebook.com/{FB_API_VERSION}"
+    
+    # Redirect URIs - fb_redirect_uri for /auth/login, redirect_uri for the /api/auth token exchange flow
+    # Facebook matches redirect URIs exactly, so they are validated but kept verbatim
+    fb_redirect_uri: str
+    redirect_uri: str = "http://localhost:8000/api/auth/facebook/callback"
+    
+    # CORS origins, comma separated
+    cors_origins: str = "*"
+    
+    # Per-page send budget shared by all workers - Graph sub-requests allowed per period (seconds)
+    send_rate_limit: int = Field(200, gt=0)
+    send_rate_period: float = Field(60, gt=0)
+    
+    # Redis holds the send job queue and progress so they are shared across workers
+    redis_url: str = "redis://localhost:6379/0"
+    
+    # Server settings used by `python -m backend.main`
+    port: int = 8000
+    web_concurrency: int = Field(default_factory=lambda: (os.cpu_count() or 1) * 2 + 1)
+    limit_concurrency: int = 200
+    
+    @field_validator("fb_redirect_uri", "redirect_uri")
+    @classmethod
+    def _check_http_url(cls, value: str) -> str:
+        _HTTP_URL.validate_python(value)
+        return value
+
+settings = Settings()
+
+FB_APP_ID = settings.fb_app_id
+FB_APP_SECRET = settings.fb_app_secret
+FB_GRAPH_URL = settings.fb_graph_url
+FB_DIALOG_URL = f"https://www.facebook.com/{FB_API_VERSION}/dialog/oauth"
+GRAPH_BATCH_LIMIT = 50  # max sub-requests Graph accepts in one batch call
+SEND_RATE_LIMIT = settings.send_rate_limit
+SEND_RATE_PERIOD = settings.send_rate_period
+
+FB_REDIRECT_URI = settings.fb_redirect_uri
+REDIRECT_URI = settings.redirect_uri
+
+# Split once here rather than per request
+CORS_ORIGINS = [origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()]
+
+REDIS_URL = settings.redis_url
@@ -0,0 +1,7 @@
+"""Send job bookkeeping shared by the API and the arq worker"""
+
+# Send progress lives in Redis so any API worker can report it
+JOB_TTL = 24 * 60 * 60  # seconds a job's counters stay around after their last update
+
+def job_key(job_id: str) -> str:
+    return f"send_job:{job_id}"
@@ -0,0 +1,25 @@
+"""Request and response schemas"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+class FacebookPage(BaseModel):
+    id: str
+    name: str
+    category: Optional[str] = None
+
+class ConversationMessage(BaseModel):
+    id: str
+    sender_name: str
+    sender_id: str
+    message: str
+    created_time: str
+
+class MessageSendConfig(BaseModel):
+    page_id: str
+    access_token: str
+    message_text: str
+    recipient_ids: List[str]
+    delay_between_messages: int = 5  # unused - sends are paced by the per-page rate limiter
+    batch_size: int = Field(10, ge=1)  # messages per Graph batch request (capped at 50)
+    batch_delay: int = 30  # unused - sends are paced by the per-page rate limiter
@@ -0,0 +1,68 @@
+"""OAuth endpoints"""
+
+from fastapi import APIRouter, HTTPException, Request
+from urllib.parse import quote_plus
+
+from ..config import FB_APP_ID, FB_APP_SECRET, FB_DIALOG_URL, FB_REDIRECT_URI, REDIRECT_URI
+
+router = APIRouter()
+
+# OAuth dialog URLs only depend on process-constant config, so build them once
+_SCOPE_ENC = quote_plus("pages_show_list,pages_read_engagement,pages_manage_metadata,pages_messaging,business_management")
+_REDIR_ENC = quote_plus(FB_REDIRECT_URI)
+_AUTH_URL = (
+    f"{FB_DIALOG_URL}?client_id={quote_plus(FB_APP_ID)}&redirect_uri={_REDIR_ENC}"
+    f"&response_type=code&scope={_SCOPE_ENC}"
+)
+_LOGIN_RESPONSE = {"auth_url": _AUTH_URL, "message": "Redirect to this URL to login with Facebook"}
+
+_AUTH_REDIRECT_RESPONSE = {
+    "auth_url": (
+        f"{FB_DIALOG_URL}?"
+        f"client_id={FB_APP_ID}&"
+        f"redirect_uri={REDIRECT_URI}&"
+        f"scope=pages_manage_messages,pages_read_engagement,pages_manage_metadata&"
+        f"display=popup&"
+        f"response_type=code"
+    )
+}
+
+@router.get("/auth/login")
+async def facebook_login():
+    return _LOGIN_RESPONSE
+
+@router.get("/auth/facebook/callback")
+async def facebook_callback(code: str = None, error: str = None):
+    if error:
+        return {"error": error}
+    if code:
+        return {
+            "code": code,
+            "message": "Authorization code received! Exchange this for tokens.",
+            "next_step": "POST /auth/exchange-token with this code"
+        }
+    return {"error": "No authorization code received"}
+
+@router.get("/api/auth/facebook/redirect")
+async def facebook_auth_redirect():
+    return _AUTH_REDIRECT_RESPONSE
+
+@router.get("/api/auth/facebook/callback")
+async def facebook_auth_callback(code: str, request: Request):
+    params = {
+        "client_id": FB_APP_ID,
+        "client_secret": FB_APP_SECRET.get_secret_value(),
+        "redirect_uri": REDIRECT_URI,
+        "code": code
+    }
+    
+    response = await request.app.state.http.get("/oauth/access_token", params=params)
+    data = response.json()
+    
+    if "access_token" not in data:
+        raise HTTPException(status_code=400, detail="Failed to get access token")
+    
+    return {
+        "access_token": data["access_token"],
+        "token_type": data.get("token_type", "bearer")
+    }
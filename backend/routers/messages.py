@@ -0,0 +1,45 @@
+"""Bulk message sending endpoints"""
+
+from fastapi import APIRouter, HTTPException, Request
+import uuid
+
+from ..models import MessageSendConfig
+from ..jobs import JOB_TTL, job_key
+
+router = APIRouter()
+
+@router.post("/api/send-messages")
+async def send_messages(config: MessageSendConfig, request: Request):
+    job_id = uuid.uuid4().hex
+    redis = request.app.state.redis
+    
+    await redis.hset(job_key(job_id), mapping={
+        "status": "processing",
+        "total": len(config.recipient_ids),
+        "ok": 0,
+        "fail": 0
+    })
+    await redis.expire(job_key(job_id), JOB_TTL)
+    
+    # The send loop runs in the arq worker, keeping this process free to serve requests
+    await redis.enqueue_job("send_messages_task", job_id, config.model_dump())
+    return {
+        "job_id": job_id,
+        "status": "processing",
+        "message": f"Started sending {len(config.recipient_ids)} messages",
+        "total_recipients": len(config.recipient_ids)
+    }
+
+@router.get("/api/send-messages/{job_id}")
+async def get_send_status(job_id: str, request: Request):
+    job = await request.app.state.redis.hgetall(job_key(job_id))
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return {
+        "job_id": job_id,
+        "status": job.get(b"status", b"unknown").decode(),
+        "total_recipients": int(job.get(b"total", 0)),
+        "successful": int(job.get(b"ok", 0)),
+        "failed": int(job.get(b"fail", 0))
+    }
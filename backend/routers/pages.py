@@ -0,0 +1,114 @@
+"""Pages and conversations endpoints"""
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from typing import Callable, List, Optional
+import httpx
+import orjson
+
+from ..cache import cache_key, pages_cache
+from ..models import ConversationMessage, FacebookPage
+
+router = APIRouter()
+
+# Graph pagination - stream list endpoints page by page as NDJSON
+# The response is already 200 once streaming, so a failing later page ends the
+# stream with a final {"error": ...} line instead of a silently truncated list
+async def _paged(client: httpx.AsyncClient, data: dict, transform: Optional[Callable[[dict], dict]] = None):
+    while True:
+        for item in data.get("data", []):
+            yield transform(item) if transform else item
+        
+        next_url = data.get("paging", {}).get("next")
+        if not next_url:
+            return
+        
+        try:
+            response = await client.get(next_url)
+            data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            yield {"error": str(e) or type(e).__name__}
+            return
+        
+        if "error" in data:
+            yield {"error": data["error"].get("message", "Graph API error")}
+            return
+
+def _ndjson(items) -> StreamingResponse:
+    return StreamingResponse(
+        (orjson.dumps(item) + b"\n" async for item in items),
+        media_type="application/x-ndjson"
+    )
+
+# List endpoints return plain dicts straight to orjson; the models only document the responses
+@router.get("/api/pages", response_model=None, responses={200: {"model": List[FacebookPage]}})
+async def get_user_pages(access_token: str, request: Request):
+    key = cache_key(access_token)
+    cached = pages_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    params = {
+        "access_token": access_token,
+        "fields": "id,name,category"
+    }
+    
+    response = await request.app.state.http.get("/me/accounts", params=params)
+    data = response.json()
+    
+    if "error" in data:
+        raise HTTPException(status_code=400, detail=data["error"]["message"])
+    
+    pages = [
+        {"id": page["id"], "name": page["name"], "category": page.get("category")}
+        for page in data.get("data", [])
+    ]
+    pages_cache[key] = pages
+    return pages
+
+@router.get("/api/conversations")
+async def get_page_conversations(page_id: str, access_token: str, request: Request):
+    params = {
+        "access_token": access_token,
+        "fields": "id,participants,senders,created_time",
+        "limit": 100
+    }
+    
+    client = request.app.state.http
+    response = await client.get(f"/{page_id}/conversations", params=params)
+    data = response.json()
+    
+    if "error" in data:
+        raise HTTPException(status_code=400, detail=data["error"]["message"])
+    
+    return _ndjson(_paged(client, data))
+
+@router.get(
+    "/api/conversation-messages",
+    response_model=None,
+    responses={200: {"model": ConversationMessage, "description": "One message per NDJSON line, ending with an {\"error\": ...} line if a later page fails"}}
+)
+async def get_conversation_messages(conversation_id: str, access_token: str, request: Request):
+    params = {
+        "access_token": access_token,
+        "fields": "id,from{name},message,created_time",
+        "limit": 100
+    }
+    
+    client = request.app.state.http
+    response = await client.get(f"/{conversation_id}/messages", params=params)
+    data = response.json()
+    
+    if "error" in data:
+        raise HTTPException(status_code=400, detail=data["error"]["message"])
+    
+    def _message(msg: dict) -> dict:
+        return {
+            "id": msg["id"],
+            "sender_name": msg["from"]["name"],
+            "sender_id": msg["from"]["id"],
+            "message": msg.get("message", ""),
+            "created_time": msg["created_time"]
+        }
+    
+    return _ndjson(_paged(client, data, _message))
@@ -0,0 +1,143 @@
+"""arq worker running the bulk send jobs
+
+Run with: arq backend.worker.WorkerSettings
+"""
+
+from arq.connections import ArqRedis, RedisSettings
+import aiohttp
+import asyncio
+import logging
+import orjson
+from typing import List
+from urllib.parse import urlencode
+from yarl import URL
+
+from .config import FB_GRAPH_URL, GRAPH_BATCH_LIMIT, REDIS_URL, SEND_RATE_LIMIT, SEND_RATE_PERIOD
+from .jobs import JOB_TTL, job_key
+from .models import MessageSendConfig
+
+logger = logging.getLogger(__name__)
+
+# Facebook budgets sends per page, so every job for a page - on any worker - shares one
+# token bucket in Redis. The script refills it from Redis' own clock and either takes
+# the tokens or returns how many seconds the caller has to wait for them.
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local amount = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * capacity / period)
+local wait = 0
+if tokens >= amount then
+    tokens = tokens - amount
+else
+    wait = (amount - tokens) * period / capacity
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(period) * 2)
+return tostring(wait)
+"""
+
+async def _acquire(ctx: dict, page_id: str, amount: int):
+    while True:
+        wait = float(await ctx["token_bucket"](keys=[f"send_rate:{page_id}"], args=[SEND_RATE_LIMIT, SEND_RATE_PERIOD, amount]))
+        if not wait:
+            return
+        await asyncio.sleep(wait)
+
+async def send_messages_task(ctx: dict, job_id: str, config: dict):
+    session: aiohttp.ClientSession = ctx["session"]
+    redis: ArqRedis = ctx["redis"]
+    key = job_key(job_id)
+    
+    try:
+        config = MessageSendConfig(**config)
+        
+        # One Graph batch request carries up to GRAPH_BATCH_LIMIT sends, processed in parallel by Facebook
+        batch_url = URL(f"{FB_GRAPH_URL}/").with_query(access_token=config.access_token)
+        relative_url = f"{config.page_id}/messages"
+        chunk_size = min(config.batch_size, GRAPH_BATCH_LIMIT, SEND_RATE_LIMIT)
+        
+        # Only the recipient id changes per message, so encode the rest of the sub-request body once
+        message_field = urlencode({"message": orjson.dumps({"text": config.message_text}).decode()})
+        
+        def _sub_request(recipient_id: str) -> dict:
+            recipient_field = urlencode({"recipient": orjson.dumps({"id": recipient_id}).decode()})
+            return {"method": "POST", "relative_url": relative_url, "body": f"{recipient_field}&{message_field}"}
+        
+        async def _send_batch(recipient_ids: List[str]) -> int:
+            batch = orjson.dumps([_sub_request(rid) for rid in recipient_ids]).decode()
+            try:
+                async with session.post(batch_url, data={"batch": batch}) as response:
+                    if response.status != 200:
+                        return 0
+                    results = await response.json(content_type=None)
+            except Exception:
+                return 0
+            # A non-list body is an error object for the whole batch
+            if not isinstance(results, list):
+                return 0
+            # Each entry is the sub-response, or null if Facebook timed it out
+            return sum(1 for result in results if isinstance(result, dict) and result.get("code") == 200)
+        
+        # A retry after a worker restart resumes past the recipients already tallied,
+        # so an interruption costs at most the batch that was in flight
+        ok, fail = await redis.hmget(key, "ok", "fail")
+        done = int(ok or 0) + int(fail or 0)
+        await _set_status(redis, key, "processing")
+        
+        recipients = config.recipient_ids
+        for start in range(done, len(recipients), chunk_size):
+            chunk = recipients[start:start + chunk_size]
+            # Each sub-request counts against the page's budget, so take one token per recipient
+            await _acquire(ctx, config.page_id, len(chunk))
+            sent = await _send_batch(chunk)
+            
+            # One round trip per Graph batch for both counters, refreshing the TTL
+            # so a long or long-queued campaign never outlives its hash
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.hincrby(key, "ok", sent)
+                pipe.hincrby(key, "fail", len(chunk) - sent)
+                pipe.expire(key, JOB_TTL)
+                await pipe.execute()
+        
+        await _set_status(redis, key, "completed")
+    except asyncio.CancelledError:
+        # Shutdown or job_timeout - arq re-runs the job if it has tries left, which resets
+        # the status, otherwise it never calls us again and this is the final word
+        logger.warning("Send job %s interrupted", job_id)
+        await asyncio.shield(_set_status(redis, key, "interrupted"))
+        raise
+    except Exception:
+        logger.exception("Send job %s failed", job_id)
+        await _set_status(redis, key, "failed")
+
+async def _set_status(redis: ArqRedis, key: str, status: str):
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.hset(key, "status", status)
+        pipe.expire(key, JOB_TTL)
+        await pipe.execute()
+
+# Shared aiohttp session - one connection pool for the whole worker lifetime
+async def startup(ctx: dict):
+    # Generous keepalive_timeout so sends reuse the connection while waiting on the rate limiter
+    ctx["session"] = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+    ctx["token_bucket"] = ctx["redis"].register_script(_TOKEN_BUCKET_LUA)
+
+async def shutdown(ctx: dict):
+    await ctx["session"].close()
+
+class WorkerSettings:
+    functions = [send_messages_task]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(REDIS_URL)
+    job_timeout = JOB_TTL  # rate-limited campaigns run far past arq's 5 minute default
+    max_tries = 5  # retries only follow an interruption, and resume where the last try stopped